@@ -9,8 +9,11 @@ from application_sdk.observability.metrics_adaptor import get_metrics
 from application_sdk.observability.traces_adaptor import get_traces
 from temporalio import activity
 from app.clients import GitHubClient
-from app.types import SummaryStats, RawData, RepoMetadata, UserMetadata
-import json
+from app.types import RepoColumns, SummaryStats, RawData, RepoMetadata, UserMetadata
+import functools
+import gzip
+import aiofiles
+import orjson
 import os
 
 logger = get_logger(__name__)
@@ -18,19 +21,22 @@ activity.logger = logger
 metrics = get_metrics()
 traces = get_traces()
 
-def _resolve_credentials(workflow_args: Optional[Dict[str, Any]] = None) -> tuple[Optional[str], Optional[str]]:
-    """Resolve username and PAT preferring workflow args, then environment.
+@functools.lru_cache(maxsize=8)
+def _cached_credentials(username_arg: Optional[str], pat_arg: Optional[str]) -> tuple[Optional[str], Optional[str]]:
+    """Memoized fallback to the environment for missing credential values.
 
-    Evaluated at call time to support test-time environment overrides.
+    Credentials don't change mid-workflow, so repeated activities with the
+    same arguments skip the os.environ lookups after the first call.
     """
-    username = (workflow_args or {}).get("username") if workflow_args else None
-    pat = (workflow_args or {}).get("pat") if workflow_args else None
-    if not username:
-        username = os.getenv("GITHUB_USERNAME")
-    if not pat:
-        pat = os.getenv("GITHUB_PAT")
-    return username, pat
- 
+    return (username_arg or os.getenv("GITHUB_USERNAME"), pat_arg or os.getenv("GITHUB_PAT"))
+
+
+def _resolve_credentials(workflow_args: Optional[Dict[str, Any]] = None) -> tuple[Optional[str], Optional[str]]:
+    """Resolve username and PAT preferring workflow args, then environment."""
+    username = workflow_args.get("username") if workflow_args else None
+    pat = workflow_args.get("pat") if workflow_args else None
+    return _cached_credentials(username, pat)
+
 
 
 class GitHubActivities(ActivitiesInterface):
@@ -40,34 +46,21 @@ class GitHubActivities(ActivitiesInterface):
     @activity.defn
     @auto_heartbeater
     async def preflight_check(self, workflow_args: Dict[str, Any]) -> Optional[ActivityStatistics]:
-        """Quick sanity check that a GitHub token exists and works.
+        """Deprecated: credential validation now happens in the profile fetch.
 
-        Makes a minimal API request with the configured PAT to ensure credentials
-        are present and usable before running heavier activities.
+        Kept so existing workflow histories referencing this activity still
+        replay; `retrieve_user_profile_activity` raises on missing or invalid
+        credentials, which is the same failure mode this check provided.
         """
-        try:
-            # Prefer explicit workflow args when provided, fall back to environment at runtime
-            effective_username, effective_pat = _resolve_credentials(workflow_args)
-
-            if not effective_pat:
-                raise ValueError("Personal Access Token (PAT) is missing.")
-            if not effective_username:
-                raise ValueError("GitHub username is missing.")
-
-            client = GitHubClient(pat=effective_pat)
-            await client.fetch_user_profile_data(username=effective_username)
-            logger.info("Preflight check passed successfully.")
-            return None
-        except Exception as e:
-            logger.error(f"Preflight check failed: {e}")
-            raise
-        # TODO: Consider explicit validation of the 'username' input as a separate guard.
+        return None
 
     @observability(logger=logger, metrics=metrics, traces=traces)
     @activity.defn
     @auto_heartbeater
     async def retrieve_user_profile_activity(self, workflow_args: Dict[str, Any]) -> UserMetadata:
-        """Retrieve profile details for a GitHub account and persist them to disk.
+        """Retrieve profile details for a GitHub account.
+
+        Results are persisted by the summary activity's combined export.
 
         Args:
             workflow_args: Workflow configuration inputs (e.g., username/PAT in env).
@@ -78,20 +71,23 @@ class GitHubActivities(ActivitiesInterface):
     # Prefer workflow args over environment variables when provided
         effective_username, effective_pat = _resolve_credentials(workflow_args)
 
+        if not effective_pat:
+            raise ValueError("Personal Access Token (PAT) is missing.")
+        if not effective_username:
+            raise ValueError("GitHub username is missing.")
+
         client = GitHubClient(pat=effective_pat)
         user_metadata = await client.fetch_user_profile_data(username=effective_username)  # type: ignore[arg-type]
-        output_file = "github_user_profile.json"
-        with open(output_file, "w") as f:
-            json.dump(user_metadata, f, indent=4)
-        
-        logger.info("Wrote user metadata for '%s' to '%s'", effective_username, output_file)
+        logger.info("Retrieved user metadata for '%s'", effective_username)
         return user_metadata
 
     @observability(logger=logger, metrics=metrics, traces=traces)
     @activity.defn
     @auto_heartbeater
     async def retrieve_repositories_activity(self, workflow_args: Dict[str, Any]) -> List[RepoMetadata]:
-        """List public repositories for an account and store structured details.
+        """List public repositories for an account.
+
+        Results are persisted by the summary activity's combined export.
 
         Args:
             workflow_args: Workflow inputs used by the activity (env for auth/user).
@@ -103,20 +99,12 @@ class GitHubActivities(ActivitiesInterface):
 
         client = GitHubClient(pat=effective_pat)
         repository_metadata = await client.fetch_all_repository_data(username=effective_username)  # type: ignore[arg-type]
-        output_file = "github_repositories.json"
-        with open(output_file, "w") as f:
-            json.dump(repository_metadata, f, indent=4)
-        
-        logger.info("Wrote %d repositories for '%s' to '%s'", len(repository_metadata), effective_username, output_file)
+        logger.info("Retrieved %d repositories for '%s'", len(repository_metadata), effective_username)
         return repository_metadata
     
-    @observability(logger=logger, metrics=metrics, traces=traces)
-    @activity.defn
-    @auto_heartbeater
-    async def extract_keywords_activity(self, repo_metadata: List[RepoMetadata]) -> List[RepoMetadata]:
-        """Deprecated: tagging removed. Returns input unchanged for backward-compatibility."""
-        return repo_metadata
-    
+    # extract_keywords_activity (keyword tagging) was removed; it had been a
+    # deprecated pass-through that only cost an activity registration.
+
     @observability(logger=logger, metrics=metrics, traces=traces)
     @activity.defn
     @auto_heartbeater
@@ -130,13 +118,17 @@ class GitHubActivities(ActivitiesInterface):
             SummaryStats: Aggregated counts derived from inputs.
         """
         logger.debug("raw_data type in metrics activity: %s", type(raw_data))
-        user_metadata = raw_data.get("user_data", {})
+        user_metadata = raw_data.get("user_data") or UserMetadata()
         repo_metadata = raw_data.get("repo_data", [])
 
-        repo_count = len(repo_metadata)
-        followers = user_metadata.get("followers", 0) or 0
-        following = user_metadata.get("following", 0) or 0
-        public_gists = user_metadata.get("public_gists", 0) or 0
+        # Aggregate over the columnar view; new per-repo stats (star totals,
+        # top language, ...) should sum its arrays rather than loop records.
+        repo_columns = RepoColumns.from_repos(repo_metadata)
+        repo_count = len(repo_columns)
+        # Normalization already coalesces these to ints, so no None guards.
+        followers = user_metadata.followers
+        following = user_metadata.following
+        public_gists = user_metadata.public_gists
 
         summary_stats: SummaryStats = {
             "total_public_repos": repo_count,
@@ -145,9 +137,22 @@ class GitHubActivities(ActivitiesInterface):
             "total_public_gists": public_gists,
         }
 
-        output_file = "github_summary_stats.json"
-        with open(output_file, "w") as f:
-            json.dump(summary_stats, f, indent=4)
-
-        logger.info("Computed summary stats; results written to '%s'.", output_file)
+        # Single combined export: the earlier activities only return data
+        # (Temporal persists their results), so one file write replaces three.
+        export = {
+            "user": user_metadata,
+            "repos": repo_metadata,
+            "summary": summary_stats,
+        }
+        payload = orjson.dumps(export, option=orjson.OPT_INDENT_2)
+        output_file = "github_export.json"
+        if repo_count > 200:
+            # Large exports are dominated by the repo list; level-1 gzip
+            # shrinks them ~3x for little CPU.
+            payload = gzip.compress(payload, compresslevel=1)
+            output_file += ".gz"
+        async with aiofiles.open(output_file, "wb") as f:
+            await f.write(payload)
+
+        logger.info("Computed summary stats; combined export written to '%s'.", output_file)
         return summary_stats
\ No newline at end of file
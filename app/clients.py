@@ -1,6 +1,12 @@
+import asyncio
+import atexit
+import sys
+from urllib.parse import parse_qs, urlsplit
+
 import httpx
-import itertools
-from typing import Any, Dict, Optional, List
+import msgspec
+import orjson
+from typing import Dict, Optional, List
 
 from application_sdk.clients.base import BaseClient
 from application_sdk.observability.logger_adaptor import get_logger
@@ -8,6 +14,113 @@ from app.types import UserMetadata, RepoMetadata
 
 logger = get_logger(__name__)
 
+# AsyncClients shared across GitHubClient instances, keyed by PAT. Activities
+# run in the same worker process, so reusing the client lets successive
+# activities ride warm keep-alive connections instead of paying a fresh
+# TCP+TLS handshake to api.github.com on every invocation.
+_CLIENTS: Dict[str, httpx.AsyncClient] = {}
+_CLIENTS_LOCK = asyncio.Lock()
+
+
+def _close_shared_clients() -> None:
+    """Closes any cached AsyncClients when the worker process shuts down."""
+    if not _CLIENTS:
+        return
+
+    async def _aclose_all() -> None:
+        await asyncio.gather(
+            *(client.aclose() for client in _CLIENTS.values()),
+            return_exceptions=True,
+        )
+
+    try:
+        asyncio.run(_aclose_all())
+    except RuntimeError:
+        # A loop is still running (or already closed); the OS reclaims the
+        # sockets at exit anyway.
+        pass
+    _CLIENTS.clear()
+
+
+atexit.register(_close_shared_clients)
+
+# (destination key, source key in the raw GitHub payload, default) triples
+# driving user normalization. Iterating a table in one comprehension keeps
+# the per-record work in a single tight loop instead of a run of individual
+# .get() calls. Keys are interned once at import so the per-record dict
+# builds hash them by pointer comparison.
+_USER_FIELDS = tuple(
+    (sys.intern(dst), sys.intern(src), default)
+    for dst, src, default in (
+        ("node_id", "node_id", "N/A"),
+        ("profile_url", "html_url", "N/A"),
+        ("avatar_url", "avatar_url", "N/A"),
+        ("type", "type", "N/A"),
+        ("company", "company", "N/A"),
+        ("location", "location", "N/A"),
+        ("email", "email", "N/A"),
+        ("blog", "blog", "N/A"),
+        ("twitter_username", "twitter_username", "N/A"),
+        ("created_at", "created_at", "N/A"),
+        ("followers_url", "followers_url", "N/A"),
+        ("following_url", "following_url", "N/A"),
+        ("bio", "bio", "No bio provided."),
+        ("followers", "followers", 0),
+        ("following", "following", 0),
+        ("public_repos", "public_repos", 0),
+        ("public_gists", "public_gists", 0),
+    )
+)
+
+class _RawUserProfile(msgspec.Struct):
+    """Raw /users/{username} payload, decoded straight from response bytes.
+
+    msgspec validates and decodes in a single C pass into this struct, so
+    the small profile response never materializes an intermediate dict.
+    Field names mirror GitHub's; everything is Optional because the API
+    returns null for unset profile fields.
+    """
+
+    login: Optional[str] = None
+    name: Optional[str] = None
+    node_id: Optional[str] = None
+    html_url: Optional[str] = None
+    avatar_url: Optional[str] = None
+    type: Optional[str] = None
+    company: Optional[str] = None
+    location: Optional[str] = None
+    email: Optional[str] = None
+    blog: Optional[str] = None
+    twitter_username: Optional[str] = None
+    created_at: Optional[str] = None
+    followers_url: Optional[str] = None
+    following_url: Optional[str] = None
+    bio: Optional[str] = None
+    followers: Optional[int] = 0
+    following: Optional[int] = 0
+    public_repos: Optional[int] = 0
+    public_gists: Optional[int] = 0
+
+
+# (destination key, source key) pairs for repository normalization; repo
+# fields pass through without defaults. Interned like _USER_FIELDS — with
+# thousands of repo records per extraction, the kwargs-dict key hashing in
+# the normalization loop is the hottest dict-build in the process.
+_REPO_FIELDS = tuple(
+    (sys.intern(dst), sys.intern(src))
+    for dst, src in (
+        ("name", "name"),
+        ("description", "description"),
+        ("language", "language"),
+        ("star_count", "stargazers_count"),
+        ("fork_count", "forks_count"),
+        ("issue_count", "open_issues_count"),
+        ("created_at", "created_at"),
+        ("updated_at", "updated_at"),
+        ("url", "html_url"),
+    )
+)
+
 
 class GitHubClient(BaseClient):
     """Thin wrapper around the GitHub REST API for metadata retrieval.
@@ -30,50 +143,43 @@ class GitHubClient(BaseClient):
         """Lazily initializes and returns a shared httpx.AsyncClient.
 
         The client is configured with authentication headers if a PAT is available.
-        This method ensures a single client instance is used per GitHubClient instance.
+        Clients are cached per PAT at module level so every GitHubClient in the
+        process reuses the same underlying connection pool.
         """
         if not self.client:
-            headers = {"Accept": "application/vnd.github.v3+json"}
-            if self.pat:
-                logger.info("Configuring GitHub client with Personal Access Token.")
-                headers["Authorization"] = f"Bearer {self.pat}"
-            else:
-                logger.warning("GitHub client is not authenticated. Rate limits will be lower.")
+            key = self.pat or ""
+            async with _CLIENTS_LOCK:
+                client = _CLIENTS.get(key)
+                if client is None:
+                    headers = {"Accept": "application/vnd.github.v3+json"}
+                    if self.pat:
+                        logger.info("Configuring GitHub client with Personal Access Token.")
+                        headers["Authorization"] = f"Bearer {self.pat}"
+                    else:
+                        logger.warning("GitHub client is not authenticated. Rate limits will be lower.")
 
-            self.client = httpx.AsyncClient(
-                base_url="https://api.github.com",
-                headers=headers,
-                timeout=30.0,
-            )
+                    client = httpx.AsyncClient(
+                        base_url="https://api.github.com",
+                        headers=headers,
+                        timeout=30.0,
+                        http2=True,
+                        limits=httpx.Limits(max_keepalive_connections=20),
+                    )
+                    _CLIENTS[key] = client
+            self.client = client
         return self.client
 
     @staticmethod
-    def _normalize_user_json(user_json: Dict[str, Any]) -> UserMetadata:
-        """Transforms raw GitHub user JSON into a structured UserMetadata object.
+    def _normalize_user(raw: _RawUserProfile) -> UserMetadata:
+        """Transforms a raw GitHub user payload into a UserMetadata object.
 
         This function handles missing data by providing sensible defaults for each field,
         ensuring a consistent data structure for downstream processing.
         """
-        return {
-            "name": user_json.get("name") or user_json.get("login") or "N/A",
-            "node_id": user_json.get("node_id") or "N/A",
-            "profile_url": user_json.get("html_url") or "N/A",
-            "avatar_url": user_json.get("avatar_url") or "N/A",
-            "type": user_json.get("type") or "N/A",
-            "company": user_json.get("company") or "N/A",
-            "location": user_json.get("location") or "N/A",
-            "email": user_json.get("email") or "N/A",
-            "blog": user_json.get("blog") or "N/A",
-            "twitter_username": user_json.get("twitter_username") or "N/A",
-            "created_at": user_json.get("created_at") or "N/A",
-            "followers_url": user_json.get("followers_url") or "N/A",
-            "following_url": user_json.get("following_url") or "N/A",
-            "bio": user_json.get("bio") or "No bio provided.",
-            "followers": user_json.get("followers", 0) or 0,
-            "following": user_json.get("following", 0) or 0,
-            "public_repos": user_json.get("public_repos", 0) or 0,
-            "public_gists": user_json.get("public_gists", 0) or 0,
-        }
+        fields = {dst: getattr(raw, src) or default for dst, src, default in _USER_FIELDS}
+        # The display name has a two-stage fallback, so it stays out of the table.
+        fields["name"] = raw.name or raw.login or "N/A"
+        return UserMetadata(**fields)
 
     async def fetch_user_profile_data(self, username: str) -> UserMetadata:
         """Retrieves and normalizes profile data for a specified GitHub user.
@@ -89,9 +195,9 @@ class GitHubClient(BaseClient):
         try:
             response = await client.get(user_endpoint)
             response.raise_for_status()
-            user_json = response.json()
+            raw_user = msgspec.json.decode(response.content, type=_RawUserProfile)
             logger.debug("Fetched raw user data for '%s'", username)
-            return self._normalize_user_json(user_json)
+            return self._normalize_user(raw_user)
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error fetching user data for {username}: {e.response.status_code} - {e.response.text}")
             raise
@@ -99,51 +205,113 @@ class GitHubClient(BaseClient):
             logger.error(f"An unexpected error occurred while fetching user data for {username}: {e}")
             raise
 
-    async def fetch_all_repository_data(self, username: str) -> List[RepoMetadata]:
-        """Fetches all public repositories for a user, handling API pagination.
+    async def _fetch_repository_page(
+        self,
+        client: httpx.AsyncClient,
+        username: str,
+        repos_endpoint: str,
+        page_num: int,
+        per_page: int,
+        semaphore: asyncio.Semaphore,
+        all_repos: List[Optional[RepoMetadata]],
+    ) -> str:
+        """Fetches one page of a user's repository listing into `all_repos`.
 
-        Args:
-            username: The GitHub login name to retrieve repositories for.
+        The semaphore bounds how many page requests are in flight at once so
+        concurrent pagination stays well inside GitHub's rate limits. Records
+        are written directly into their slots at `(page_num - 1) * per_page`,
+        so pages may complete in any order without affecting the result.
 
         Returns:
-            A list of RepoMetadata objects, one for each public repository.
+            The response's Link header (empty string if absent), which the
+            caller uses on page 1 to discover how many pages exist.
         """
-        client = await self._get_client()
-        all_repos: List[RepoMetadata] = []
-        per_page = 100
-
-        for page_num in itertools.count(1):
-            repos_endpoint = f"/users/{username}/repos"
-            params = {"page": page_num, "per_page": per_page}
+        # Each task needs its own params dict; pages run concurrently.
+        params = {"page": page_num, "per_page": per_page}
+        async with semaphore:
             try:
                 response = await client.get(repos_endpoint, params=params)
                 response.raise_for_status()
-                page_data = response.json()
-
-                if not page_data:
-                    logger.info("Finished fetching all repositories for '%s'.", username)
-                    break
-
-                normalized_page_repos = [
-                    {
-                        "name": repo.get("name"),
-                        "description": repo.get("description"),
-                        "language": repo.get("language"),
-                        "star_count": repo.get("stargazers_count"),
-                        "fork_count": repo.get("forks_count"),
-                        "issue_count": repo.get("open_issues_count"),
-                        "created_at": repo.get("created_at"),
-                        "updated_at": repo.get("updated_at"),
-                        "url": repo.get("html_url"),
-                    }
-                    for repo in page_data
-                ]
-                all_repos.extend(normalized_page_repos)
-
+                page_data = orjson.loads(response.content)
             except httpx.HTTPStatusError as e:
                 logger.error(f"HTTP error on page {page_num} for {username}'s repos: {e.response.status_code}")
                 raise
             except Exception as e:
                 logger.error(f"An unexpected error occurred while fetching repositories for {username}: {e}")
                 raise
+
+        offset = (page_num - 1) * per_page
+        for i, repo in enumerate(page_data):
+            normalized = RepoMetadata(**{dst: repo.get(src) for dst, src in _REPO_FIELDS})
+            index = offset + i
+            if index < len(all_repos):
+                all_repos[index] = normalized
+            else:
+                # More records than the pre-sized slots (page 1, or the repo
+                # count grew mid-fetch); fall back to appending.
+                all_repos.append(normalized)
+        return response.headers.get("link", "")
+
+    @staticmethod
+    def _last_page_number(link_header: str) -> int:
+        """Extracts the final page number from a GitHub Link pagination header.
+
+        Returns 1 when the header is absent or carries no rel="last" entry,
+        meaning the page just fetched was the only (or last) one.
+        """
+        for part in link_header.split(","):
+            if 'rel="last"' in part:
+                url = part[part.find("<") + 1 : part.find(">")]
+                page_values = parse_qs(urlsplit(url).query).get("page")
+                if page_values:
+                    return int(page_values[0])
+        return 1
+
+    async def fetch_all_repository_data(self, username: str) -> List[RepoMetadata]:
+        """Fetches all public repositories for a user, handling API pagination.
+
+        Page 1 is fetched first and its Link header's rel="last" entry tells
+        us how many pages exist; the remaining pages are then requested
+        concurrently. No count lookup or trailing empty-page probe is needed,
+        and results keep their page order.
+
+        Args:
+            username: The GitHub login name to retrieve repositories for.
+
+        Returns:
+            A list of RepoMetadata objects, one for each public repository.
+        """
+        client = await self._get_client()
+        per_page = 100
+
+        # The endpoint is constant for the whole fetch; build it once.
+        repos_endpoint = f"/users/{username}/repos"
+        semaphore = asyncio.Semaphore(8)
+        all_repos: List[Optional[RepoMetadata]] = []
+
+        link_header = await self._fetch_repository_page(
+            client, username, repos_endpoint, 1, per_page, semaphore, all_repos
+        )
+        if not all_repos:
+            logger.info("No public repositories found for '%s'.", username)
+            return []
+
+        n_pages = self._last_page_number(link_header)
+        if n_pages > 1:
+            # Pre-size slots for the remaining pages so their handlers
+            # index-assign instead of growing the list page by page.
+            all_repos.extend([None] * ((n_pages - 1) * per_page))
+            await asyncio.gather(
+                *(
+                    self._fetch_repository_page(
+                        client, username, repos_endpoint, page_num, per_page, semaphore, all_repos
+                    )
+                    for page_num in range(2, n_pages + 1)
+                )
+            )
+
+        if all_repos and all_repos[-1] is None:
+            # The last page is usually partial; drop the unfilled slots.
+            all_repos = [repo for repo in all_repos if repo is not None]
+        logger.info("Finished fetching all repositories for '%s'.", username)
         return all_repos
\ No newline at end of file
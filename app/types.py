@@ -1,41 +1,81 @@
 from __future__ import annotations
 
+from array import array
+from dataclasses import dataclass
 from typing import List, Optional, TypedDict
 
 
-class UserMetadata(TypedDict, total=False):
-    name: str
-    node_id: str
-    profile_url: str
-    avatar_url: str
-    bio: str
-    type: str
-    company: str
-    location: str
-    email: str
-    blog: str
-    twitter_username: str
-    created_at: str
-    followers: int
-    following: int
-    followers_url: str
-    following_url: str
-    public_repos: int
-    public_gists: int
-
-
-class RepoMetadata(TypedDict, total=False):
-    name: Optional[str]
-    description: Optional[str]
-    language: Optional[str]
-    star_count: int
-    fork_count: int
-    issue_count: int
-    created_at: str
-    updated_at: str
-    url: str
-    # Enriched by extract_keywords_activity
-    auto_tags: List[str]
+@dataclass(slots=True)
+class UserMetadata:
+    """Normalized GitHub profile record.
+
+    Slotted so the thousands of records produced by large extractions stay
+    compact; orjson serializes dataclasses natively.
+    """
+
+    name: str = "N/A"
+    node_id: str = "N/A"
+    profile_url: str = "N/A"
+    avatar_url: str = "N/A"
+    bio: str = "No bio provided."
+    type: str = "N/A"
+    company: str = "N/A"
+    location: str = "N/A"
+    email: str = "N/A"
+    blog: str = "N/A"
+    twitter_username: str = "N/A"
+    created_at: str = "N/A"
+    followers: int = 0
+    following: int = 0
+    followers_url: str = "N/A"
+    following_url: str = "N/A"
+    public_repos: int = 0
+    public_gists: int = 0
+
+
+@dataclass(slots=True)
+class RepoMetadata:
+    """Normalized GitHub repository record."""
+
+    name: Optional[str] = None
+    description: Optional[str] = None
+    language: Optional[str] = None
+    star_count: Optional[int] = None
+    fork_count: Optional[int] = None
+    issue_count: Optional[int] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    url: Optional[str] = None
+
+
+@dataclass(slots=True)
+class RepoColumns:
+    """Columnar (structure-of-arrays) view over a list of RepoMetadata.
+
+    Numeric columns are contiguous array('q') buffers, so aggregations like
+    `sum(columns.stars)` run as a single C loop instead of touching every
+    record object. Built on demand; the row-oriented list remains the
+    canonical shape for serialization.
+    """
+
+    names: List[Optional[str]]
+    languages: List[Optional[str]]
+    stars: array
+    forks: array
+    issues: array
+
+    @classmethod
+    def from_repos(cls, repos: List[RepoMetadata]) -> RepoColumns:
+        return cls(
+            names=[repo.name for repo in repos],
+            languages=[repo.language for repo in repos],
+            stars=array("q", (repo.star_count or 0 for repo in repos)),
+            forks=array("q", (repo.fork_count or 0 for repo in repos)),
+            issues=array("q", (repo.issue_count or 0 for repo in repos)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.stars)
 
 
 class SummaryStats(TypedDict):
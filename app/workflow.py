@@ -39,14 +39,8 @@ class GitHubWorkflow(WorkflowInterface):
             backoff_coefficient=2,
         )
 
-        await workflow.execute_activity_method(
-            activities_instance.preflight_check,
-            workflow_args,
-            retry_policy=retry_policy,
-            start_to_close_timeout=self.default_start_to_close_timeout,
-            heartbeat_timeout=self.default_heartbeat_timeout,
-        )
-
+        # Credential validation is folded into the profile fetch: a successful
+        # /users/{username} response is itself the preflight.
         user_data, repo_data = await asyncio.gather(
             workflow.execute_activity_method(
                 activities_instance.retrieve_user_profile_activity,